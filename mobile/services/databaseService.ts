@@ -27,17 +27,43 @@ export interface SyncItem {
   timestamp: number;
 }
 
+// Stored in PRAGMA user_version; createTables skips all DDL once a database reaches it.
+// Bumping this alone only re-runs CREATE ... IF NOT EXISTS, which never alters existing
+// tables: schema changes need explicit ALTER/migration steps keyed on the old version.
+const SCHEMA_VERSION = 1;
+
 class DatabaseService {
   private db: SQLite.SQLiteDatabase | null = null;
+  private initPromise: Promise<void> | null = null;
+
+  // Initialize database connection; repeat and concurrent calls share one handle
+  init(): Promise<void> {
+    if (!this.initPromise) {
+      this.initPromise = this.openDatabase().catch(error => {
+        // Let a later call retry after a failed open
+        this.initPromise = null;
+        throw error;
+      });
+    }
+    return this.initPromise;
+  }
 
-  // Initialize database connection
-  async init(): Promise<void> {
+  private async openDatabase(): Promise<void> {
     try {
       this.db = await SQLite.openDatabaseAsync('budget_buddy_mobile.db');
+      // WAL lets reads run alongside the sync-queue writes and replaces a
+      // per-commit fsync with one per checkpoint; NORMAL is safe under WAL
+      await this.db.execAsync(
+        `PRAGMA journal_mode = WAL;
+         PRAGMA synchronous = NORMAL;
+         PRAGMA temp_store = MEMORY;`
+      );
       await this.createTables();
       logger.debug('Database initialized successfully');
     } catch (error) {
       logger.error('Database initialization error', { error });
+      await this.db?.closeAsync().catch(() => undefined);
+      this.db = null;
       throw error;
     }
   }
@@ -49,6 +75,13 @@ class DatabaseService {
     }
 
     try {
+      // Schema is already current on warm starts; skip the DDL entirely
+      const versionRow = await this.db.getFirstAsync<{ user_version: number }>('PRAGMA user_version');
+      if (versionRow && versionRow.user_version >= SCHEMA_VERSION) {
+        logger.debug('Database schema up to date', { version: versionRow.user_version });
+        return;
+      }
+
       // Budget records table
       await this.db.execAsync(
         `CREATE TABLE IF NOT EXISTS budget_records (
@@ -83,10 +116,12 @@ class DatabaseService {
           updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
         );`
       );
+
+      await this.db.execAsync(`PRAGMA user_version = ${SCHEMA_VERSION};`);
       
-      console.log('✅ Database tables created successfully');
+      logger.debug('Database tables created successfully');
     } catch (error) {
-      console.error('❌ Error creating tables:', error);
+      logger.error('Error creating tables', { error });
       throw error;
     }
   }
@@ -127,10 +162,10 @@ class DatabaseService {
         insights
       });
       
-      console.log('✅ Budget record saved successfully:', result.lastInsertRowId);
+      logger.debug('Budget record saved', { id: result.lastInsertRowId });
       return result.lastInsertRowId;
     } catch (error) {
-      console.error('❌ Error saving budget record:', error);
+      logger.error('Error saving budget record', { error });
       throw error;
     }
   }
@@ -158,10 +193,10 @@ class DatabaseService {
         synced: Boolean(row.synced)
       }));
 
-      console.log('✅ Retrieved budget records:', records.length);
+      logger.debug('Retrieved budget records', { count: records.length });
       return records;
     } catch (error) {
-      console.error('❌ Error getting budget records:', error);
+      logger.error('Error getting budget records', { error });
       throw error;
     }
   }
@@ -187,9 +222,9 @@ class DatabaseService {
         ]
       );
       
-      console.log('✅ Added to sync queue:', id);
+      logger.debug('Added to sync queue', { id });
     } catch (error) {
-      console.error('❌ Error adding to sync queue:', error);
+      logger.error('Error adding to sync queue', { error });
       throw error;
     }
   }
@@ -206,9 +241,9 @@ class DatabaseService {
          VALUES (?, ?, datetime('now'))`,
         [key, value]
       );
-      console.log('✅ Setting saved:', key);
+      logger.debug('Setting saved', { key });
     } catch (error) {
-      console.error('❌ Error saving setting:', error);
+      logger.error('Error saving setting', { error, key });
       throw error;
     }
   }
@@ -226,7 +261,7 @@ class DatabaseService {
       
       return result ? (result as any).value : null;
     } catch (error) {
-      console.error('❌ Error getting setting:', error);
+      logger.error('Error getting setting', { error, key });
       throw error;
     }
   }
@@ -260,10 +295,10 @@ class DatabaseService {
       );
       const pendingSyncItems = syncResult ? (syncResult as any).count : 0;
 
-      console.log('✅ Database stats retrieved');
+      logger.debug('Database stats retrieved');
       return { totalRecords, unsyncedRecords, pendingSyncItems };
     } catch (error) {
-      console.error('❌ Error getting database stats:', error);
+      logger.error('Error getting database stats', { error });
       throw error;
     }
   }
@@ -279,9 +314,9 @@ class DatabaseService {
       await this.db.execAsync('DELETE FROM sync_queue');
       await this.db.execAsync('DELETE FROM user_settings');
       
-      console.log('✅ All data cleared successfully');
+      logger.debug('All data cleared successfully');
     } catch (error) {
-      console.error('❌ Error clearing data:', error);
+      logger.error('Error clearing data', { error });
       throw error;
     }
   }
@@ -10,6 +10,11 @@ import { useBudgetStore } from '../stores/budgetStore';
 import { useUserStore } from '../stores/userStore';
 import { logger } from '../utils/logger';
 
+// Retry policy for transient Grok API failures
+const GROK_MAX_ATTEMPTS = 3;
+const GROK_RETRY_BASE_DELAY_MS = 250;
+const GROK_RETRY_MAX_DELAY_MS = 2000;
+
 // Grok AI Integration for Budget Buddy Philippines
 class GrokAIService {
   private apiKey: string;
@@ -49,6 +54,49 @@ class GrokAIService {
     return this.apiKey !== 'PLEASE_SET_YOUR_GROK_API_KEY' && this.apiKey.length > 10;
   }
 
+  // POST to chat/completions, retrying network errors, 5xx and short-lived 429s
+  private async postChatCompletion(body: Record<string, unknown>): Promise<Response> {
+    for (let attempt = 1; ; attempt++) {
+      // Exponential backoff with full jitter, unless the server says how long to wait
+      let delayMs = Math.random() * Math.min(GROK_RETRY_MAX_DELAY_MS, GROK_RETRY_BASE_DELAY_MS * 2 ** (attempt - 1));
+
+      try {
+        const response = await fetch(`${this.baseUrl}/chat/completions`, {
+          method: 'POST',
+          headers: {
+            'Authorization': `Bearer ${this.apiKey}`,
+            'Content-Type': 'application/json',
+          },
+          body: JSON.stringify(body),
+        });
+
+        if (attempt >= GROK_MAX_ATTEMPTS || (response.status !== 429 && response.status < 500)) {
+          return response;
+        }
+
+        if (response.status === 429) {
+          // Only retry a rate limit when Retry-After fits inside our delay cap
+          const retryAfterMs = Number(response.headers.get('Retry-After')) * 1000;
+          if (!(retryAfterMs > 0 && retryAfterMs <= GROK_RETRY_MAX_DELAY_MS)) {
+            return response;
+          }
+          delayMs = retryAfterMs;
+        }
+
+        // Drain the discarded response before retrying; React Native's fetch has no body stream to cancel
+        await response.text();
+        logger.debug('Retrying Grok request', { attempt, status: response.status, delayMs });
+      } catch (error) {
+        if (attempt >= GROK_MAX_ATTEMPTS) {
+          throw error;
+        }
+        logger.debug('Retrying Grok request', { attempt, error, delayMs });
+      }
+
+      await new Promise(resolve => setTimeout(resolve, delayMs));
+    }
+  }
+
   // Get real-time data from all stores
   private getCurrentUserData() {
     const billsStore = useBillsStore.getState();
@@ -162,27 +210,20 @@ Make insights conversational, specific to Philippines, and immediately actionabl
 
       logger.debug('Making request to Grok AI with configured API key');
 
-      const response = await fetch(`${this.baseUrl}/chat/completions`, {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${this.apiKey}`,
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          model: 'grok-beta',
-          messages: [
-            {
-              role: 'system',
-              content: 'You are a Filipino financial advisor AI with deep knowledge of Philippines economics, culture, and practical money management for Filipino families.'
-            },
-            {
-              role: 'user',
-              content: prompt
-            }
-          ],
-          temperature: 0.7,
-          max_tokens: 1000,
-        }),
+      const response = await this.postChatCompletion({
+        model: 'grok-beta',
+        messages: [
+          {
+            role: 'system',
+            content: 'You are a Filipino financial advisor AI with deep knowledge of Philippines economics, culture, and practical money management for Filipino families.'
+          },
+          {
+            role: 'user',
+            content: prompt
+          }
+        ],
+        temperature: 0.7,
+        max_tokens: 1000,
       });
 
       if (!response.ok) {
@@ -435,25 +476,27 @@ Return ONLY a JSON object with adjusted amounts:
 `;
 
     try {
-      const response = await fetch(`${this.baseUrl}/chat/completions`, {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${this.apiKey}`,
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          messages: [{ role: 'user', content: prompt }],
-          model: 'grok-beta',
-          stream: false,
-        }),
+      const response = await this.postChatCompletion({
+        messages: [{ role: 'user', content: prompt }],
+        model: 'grok-beta',
+        stream: false,
+        // Reply is a flat category -> amount object; JSON mode keeps prose out of it
+        response_format: { type: 'json_object' },
+        max_tokens: 300,
       });
 
+      if (!response.ok) {
+        const errorText = await response.text();
+        logger.error('Grok API error', { status: response.status, error: errorText });
+        throw new Error(`Grok API error: ${response.status} - ${errorText}`);
+      }
+
       const result = await response.json();
       const adjustedCategories = JSON.parse(result.choices[0].message.content);
       
       return { adjustedCategories };
     } catch (error) {
-      console.warn('AI budget adjustment failed:', error);
+      logger.warn('AI budget adjustment failed', { error });
       return { adjustedCategories: currentBreakdown };
     }
   }
@@ -691,17 +734,10 @@ Format as JSON with specific metrics, reasoning, and quantified recommendations.
       throw new Error('Grok API not configured');
     }
 
-    const response = await fetch(`${this.baseUrl}/chat/completions`, {
-      method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${this.apiKey}`,
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        messages: [{ role: 'user', content: prompt }],
-        model: 'grok-beta',
-        stream: false,
-      }),
+    const response = await this.postChatCompletion({
+      messages: [{ role: 'user', content: prompt }],
+      model: 'grok-beta',
+      stream: false,
     });
 
     const result = await response.json();
@@ -2,6 +2,7 @@ import { create } from 'zustand';
 import { persist, createJSONStorage } from 'zustand/middleware';
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { grokAIService } from '../services/grokAIService';
+import { logger } from '../utils/logger';
 
 export interface Insight {
   id: string;
@@ -101,7 +102,7 @@ export const useInsightsStore = create<InsightsState>()(
         const startTime = Date.now();
         
         try {
-          console.log('🤖 Generating AI insights with real data...');
+          logger.debug('Generating AI insights with real data');
           
           // Use Grok AI service to generate intelligent insights
           const [insights, recommendations] = await Promise.all([
@@ -117,9 +118,12 @@ export const useInsightsStore = create<InsightsState>()(
             !insight.message.includes('mock') && !insight.message.includes('fallback')
           );
 
-          console.log(`✅ AI insights generated in ${aiResponseTime}ms`);
-          console.log(`🤖 Using ${isRealAI ? 'Real Grok AI' : 'Intelligent Fallback'}`);
-          console.log(`📊 Generated ${insights.length} insights with health score: ${healthScore}`);
+          logger.debug('AI insights generated', {
+            aiResponseTime,
+            source: isRealAI ? 'Real Grok AI' : 'Intelligent Fallback',
+            insightsCount: insights.length,
+            healthScore,
+          });
 
           set({
             insights,
@@ -134,7 +138,7 @@ export const useInsightsStore = create<InsightsState>()(
             error: null,
           });
         } catch (error) {
-          console.error('❌ AI insights generation failed:', error);
+          logger.error('AI insights generation failed', { error });
           set({
             error: 'Failed to generate AI insights. Using offline mode.',
             isUsingRealAI: false,
@@ -149,7 +153,7 @@ export const useInsightsStore = create<InsightsState>()(
               healthScore: 70, // Conservative score for fallback
             });
           } catch (fallbackError) {
-            console.error('❌ Even fallback insights failed:', fallbackError);
+            logger.error('Fallback insights failed', { error: fallbackError });
           }
         }
       },
@@ -229,7 +233,7 @@ export const useInsightsStore = create<InsightsState>()(
       },
 
       refreshInsights: async () => {
-        console.log('🔄 Refreshing insights with latest data...');
+        logger.debug('Refreshing insights with latest data');
         await get().generateInsights();
       },
 
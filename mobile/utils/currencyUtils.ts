@@ -2,19 +2,21 @@
  * Currency and formatting utilities for Philippines-focused Budget Buddy
  */
 
+// Force Philippines peso formatting; built once since formatCurrency runs in every list row render
+const pesoFormatter = new Intl.NumberFormat('en-PH', {
+  style: 'currency',
+  currency: 'PHP',
+  currencyDisplay: 'symbol',
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+});
+
 export const formatCurrency = (amount: number | null | undefined): string => {
   if (amount === null || amount === undefined || isNaN(amount)) {
     return '₱0.00';
   }
   
-  // Force Philippines peso formatting
-  return new Intl.NumberFormat('en-PH', {
-    style: 'currency',
-    currency: 'PHP',
-    currencyDisplay: 'symbol',
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  }).format(amount);
+  return pesoFormatter.format(amount);
 };
 
 export const formatCurrencyCompact = (amount: number | null | undefined): string => {